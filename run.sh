@@ -78,4 +78,4 @@ fi
 # Run the application
 echo "Starting Ubuntu Development Environment Manager..."
 cd "$DIR"
-python3 main.py "$@"
+python3 -m ubuntu_dev_manager "$@"
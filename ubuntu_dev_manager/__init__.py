@@ -0,0 +1,5 @@
+"""
+Ubuntu Development Environment Manager
+
+A GUI tool for managing isolated development environments using Multipass/LXD
+"""
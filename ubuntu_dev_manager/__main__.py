@@ -0,0 +1,6 @@
+"""Run the application with ``python3 -m ubuntu_dev_manager``"""
+
+from .main import main
+
+if __name__ == '__main__':
+    main()
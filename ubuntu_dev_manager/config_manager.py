@@ -0,0 +1,258 @@
+"""
+Configuration Manager - Handles application settings and preferences
+"""
+
+import copy
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from .json_utils import JSONDecodeError, dumps, dumps_pretty, loads
+
+# Valid values for enumerated settings; frozensets give O(1) membership
+# checks and are shared across all instances
+_VALID_BACKENDS = frozenset({"multipass", "lxd"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+_VALID_TERMINALS = frozenset({
+    "auto", "gnome-terminal", "konsole", "xterm",
+    "alacritty", "wezterm", "terminator"
+})
+
+
+class ConfigManager:
+    def __init__(self):
+        self.config_dir = Path.home() / ".config" / "ubuntu-dev-manager"
+        self.config_file = self.config_dir / "config.json"
+        
+        # Default configuration
+        self.default_config = {
+            "default_backend": "multipass",
+            "default_cpus": 2,
+            "default_memory": 2048,
+            "default_disk": 10,
+            "terminal_emulator": "auto",
+            "auto_start_environments": False,
+            "log_level": "INFO",
+            "theme": "system",
+            "window_geometry": {
+                "width": 1000,
+                "height": 700,
+                "x": 100,
+                "y": 100
+            },
+            "multipass": {
+                "driver": "qemu",
+                "network": "default"
+            },
+            "lxd": {
+                "storage_pool": "default",
+                "network": "lxdbr0"
+            },
+            "templates": {
+                "custom_templates_enabled": True,
+                "auto_update_templates": False
+            }
+        }
+        
+        # Flattened dotted-key view of the defaults plus a split-key cache,
+        # so get/set/reset_key stop re-splitting strings and walking dicts
+        self._flat_defaults: Dict[str, Any] = {}
+        self._flatten('', self.default_config, self._flat_defaults)
+        self._key_parts_cache: Dict[str, tuple] = {}
+
+        self.config = self.load()
+        # Track unsaved changes so save() can skip redundant full-file writes
+        self._dirty = False
+
+    @staticmethod
+    def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]):
+        """Recursively merge src into dst, preserving nested defaults"""
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                ConfigManager._deep_merge(dst[key], value)
+            else:
+                dst[key] = value
+
+    @staticmethod
+    def _flatten(prefix: str, node: Dict[str, Any], out: Dict[str, Any]):
+        """Record every node of a nested dict under its dotted key"""
+        for key, value in node.items():
+            dotted = prefix + key
+            out[dotted] = value
+            if isinstance(value, dict):
+                ConfigManager._flatten(dotted + '.', value, out)
+
+    def _split_key(self, key: str) -> tuple:
+        """Split a dotted key into parts, caching the result"""
+        parts = self._key_parts_cache.get(key)
+        if parts is None:
+            parts = self._key_parts_cache[key] = tuple(key.split('.'))
+        return parts
+
+    def load(self) -> Dict[str, Any]:
+        """Load configuration from file"""
+        if not self.config_file.exists():
+            return copy.deepcopy(self.default_config)
+        
+        try:
+            with open(self.config_file, 'rb') as f:
+                loaded_config = loads(f.read())
+
+            # Merge with defaults to ensure all keys exist, including nested ones
+            config = copy.deepcopy(self.default_config)
+            self._deep_merge(config, loaded_config)
+            return config
+
+        except (JSONDecodeError, IOError) as e:
+            print(f"Warning: Failed to load config file: {e}")
+            return copy.deepcopy(self.default_config)
+    
+    def save(self):
+        """Save configuration to file (no-op if nothing changed)"""
+        if not self._dirty:
+            return
+
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+        try:
+            # Created lazily on first write; a stat beats a mkdir syscall
+            # on the overwhelmingly common already-exists path
+            if not self.config_dir.exists():
+                self.config_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write compact JSON to a temp file and rename it into place, so
+            # a crash mid-write can never leave a truncated config behind
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps(self.config))
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+        except IOError as e:
+            raise RuntimeError(f"Failed to save configuration: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value"""
+        keys = self._split_key(key)
+        value = self.config
+        
+        for k in keys:
+            if isinstance(value, dict) and k in value:
+                value = value[k]
+            else:
+                return default
+        
+        return value
+    
+    def set(self, key: str, value: Any):
+        """Set a configuration value"""
+        keys = self._split_key(key)
+        config = self.config
+        
+        # Navigate to the parent dictionary
+        for k in keys[:-1]:
+            if k not in config or not isinstance(config[k], dict):
+                config[k] = {}
+            config = config[k]
+        
+        # Set the value
+        config[keys[-1]] = value
+        self._dirty = True
+    
+    def update(self, updates: Dict[str, Any]):
+        """Update multiple configuration values"""
+        for key, value in updates.items():
+            self.set(key, value)
+    
+    def reset(self):
+        """Reset configuration to defaults"""
+        self.config = copy.deepcopy(self.default_config)
+        self._dirty = True
+    
+    def reset_key(self, key: str):
+        """Reset a specific key to its default value"""
+        if key not in self._flat_defaults:
+            return  # Key doesn't exist in defaults
+
+        self.set(key, copy.deepcopy(self._flat_defaults[key]))
+    
+    def export_config(self, filepath: str):
+        """Export configuration to a file"""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(dumps_pretty(self.config))
+        except IOError as e:
+            raise RuntimeError(f"Failed to export configuration: {e}")
+    
+    def import_config(self, filepath: str):
+        """Import configuration from a file"""
+        try:
+            with open(filepath, 'rb') as f:
+                imported_config = loads(f.read())
+
+            # Merge with current config without clobbering nested defaults
+            self._deep_merge(self.config, imported_config)
+            self._dirty = True
+
+        except (JSONDecodeError, IOError) as e:
+            raise RuntimeError(f"Failed to import configuration: {e}")
+    
+    # Per-field validation rules: each returns True or an error message.
+    # Top-level keys are read with a direct dict lookup, skipping the
+    # dotted-key machinery in get().
+    _VALIDATORS = {
+        'default_backend': lambda v: v in _VALID_BACKENDS
+            or "Must be 'multipass' or 'lxd'",
+        'default_cpus': lambda v: (isinstance(v, int) and 1 <= v <= 32)
+            or "Must be an integer between 1 and 32",
+        'default_memory': lambda v: (isinstance(v, int) and 512 <= v <= 32768)
+            or "Must be an integer between 512 and 32768 MB",
+        'default_disk': lambda v: (isinstance(v, int) and 5 <= v <= 1000)
+            or "Must be an integer between 5 and 1000 GB",
+        'log_level': lambda v: v in _VALID_LOG_LEVELS
+            or "Must be DEBUG, INFO, WARNING, or ERROR",
+    }
+
+    def validate_config(self) -> Dict[str, str]:
+        """Validate configuration and return any errors"""
+        errors = {}
+
+        for key, rule in self._VALIDATORS.items():
+            result = rule(self.config.get(key))
+            if result is not True:
+                errors[key] = result
+
+        return errors
+    
+    def get_backends_config(self) -> Dict[str, Dict[str, Any]]:
+        """Get backend-specific configuration"""
+        return {
+            'multipass': self.get('multipass', {}),
+            'lxd': self.get('lxd', {})
+        }
+    
+    def get_window_geometry(self) -> Dict[str, int]:
+        """Get window geometry settings
+
+        Read with a direct dict lookup — this runs on resize/move events,
+        so it skips the dotted-key machinery in get().
+        """
+        return self.config.get('window_geometry', self.default_config['window_geometry'])
+
+    def set_window_geometry(self, width: int, height: int, x: int, y: int):
+        """Set window geometry settings"""
+        self.config['window_geometry'] = {
+            'width': width,
+            'height': height,
+            'x': x,
+            'y': y
+        }
+        self._dirty = True
+
+    def get_terminal_preference(self) -> str:
+        """Get preferred terminal emulator"""
+        return self.get('terminal_emulator', 'auto')
+    
+    def set_terminal_preference(self, terminal: str):
+        """Set preferred terminal emulator"""
+        if terminal not in _VALID_TERMINALS:
+            raise ValueError(f"Invalid terminal: {terminal}")
+        
+        self.set('terminal_emulator', terminal)
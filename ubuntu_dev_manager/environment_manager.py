@@ -0,0 +1,618 @@
+"""
+Environment Manager - Handles Multipass/LXD operations
+"""
+
+import functools
+import subprocess
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from pathlib import Path
+
+from .json_utils import JSONDecodeError, dumps, loads
+
+# Known terminal emulators and how to launch a command in them, in probe order
+_TERMINAL_COMMANDS = {
+    "gnome-terminal": ["gnome-terminal", "--", "bash", "-c"],
+    "konsole": ["konsole", "-e", "bash", "-c"],
+    "xterm": ["xterm", "-e", "bash", "-c"],
+    "alacritty": ["alacritty", "-e", "bash", "-c"],
+    "wezterm": ["wezterm", "start", "bash", "-c"],
+}
+
+# Shared pool for independent backend probes; avoids per-call thread creation
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Separate pool for environment creations: a bring-up is cloud-init bound
+# and runs for minutes, so a batch on _POOL would starve the short-lived
+# list_environments collector tasks and freeze every refresh behind it
+_CREATE_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_instance():
+    """Shared EnvironmentTemplates instance, built on first use"""
+    from .templates import EnvironmentTemplates
+    return EnvironmentTemplates()
+
+
+def invalidate_templates_cache():
+    """Drop the shared templates instance so it is rebuilt on next use"""
+    _templates_instance.cache_clear()
+
+
+class EnvironmentManager:
+    def __init__(self):
+        self.config_dir = Path.home() / ".config" / "ubuntu-dev-manager"
+        self.environments_file = self.config_dir / "environments.json"
+        # Short-lived cache of list_environments() results so single-button
+        # actions don't re-run a full multipass/lxc scan on every click
+        self._env_cache: Optional[List[Dict]] = None
+        self._env_cache_ts = 0.0
+        self._env_cache_ttl = 5.0
+        # Backend availability is a property of the machine and doesn't
+        # change during a normal session; probe each backend at most once
+        self._backend_available: Dict[str, bool] = {}
+        # Detected terminal emulator command, probed once per session
+        self._terminal_cmd: Optional[List[str]] = None
+        # Serializes read-modify-write of environments.json: concurrent
+        # creations finishing together must not overwrite each other's
+        # registry entries
+        self._registry_lock = threading.Lock()
+
+    def _load_environments_config(self) -> Dict:
+        """Load environment configurations from file"""
+        if self.environments_file.exists():
+            try:
+                with open(self.environments_file, 'rb') as f:
+                    return loads(f.read())
+            except (JSONDecodeError, IOError):
+                pass
+        return {}
+    
+    def _save_environments_config(self, config: Dict):
+        """Save environment configurations to file"""
+        tmp_file = self.environments_file.with_name(self.environments_file.name + '.tmp')
+        try:
+            # Created lazily on first write, matching ConfigManager.save()
+            if not self.config_dir.exists():
+                self.config_dir.mkdir(parents=True, exist_ok=True)
+
+            # Temp-file write + atomic rename; see ConfigManager.save()
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps(config))
+            os.replace(tmp_file, self.environments_file)
+        except IOError as e:
+            raise RuntimeError(f"Failed to save environment config: {e}")
+    
+    def _run_command(self, cmd: List[str], capture_output=True, text=True) -> subprocess.CompletedProcess:
+        """Run a command and return the result"""
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=capture_output,
+                text=text,
+                check=True
+            )
+            return result
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Command failed: {' '.join(cmd)}\nError: {stderr}")
+        except FileNotFoundError:
+            raise RuntimeError(f"Command not found: {cmd[0]}")
+
+    def _run_command_async(self, cmd: List[str]) -> subprocess.Popen:
+        """Start a command without waiting for it; returns the process handle"""
+        try:
+            return subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"Command not found: {cmd[0]}")
+
+    def _run_command_bytes(self, cmd: List[str]) -> bytes:
+        """Run a command and return raw stdout bytes
+
+        Skips the UTF-8 decode that text=True performs; JSON output can
+        be handed to loads() as bytes, which orjson parses natively.
+        """
+        return self._run_command(cmd, text=False).stdout
+    
+    def _check_backend_available(self, backend: str) -> bool:
+        """Check if a backend CLI is installed (memoized per backend)
+
+        This is a pure PATH lookup — no subprocess spawn. It proves the
+        CLI exists, not that the daemon is up; use check_backend_running
+        when daemon liveness matters.
+        """
+        cached = self._backend_available.get(backend)
+        if cached is not None:
+            return cached
+
+        binary = "multipass" if backend == "multipass" else "lxc"
+        available = shutil.which(binary) is not None
+
+        self._backend_available[backend] = available
+        return available
+
+    def check_backend_running(self, backend: str) -> bool:
+        """Check that a backend's daemon actually responds
+
+        Slow path: runs `multipass version` / `lxc version`, which talks
+        to the daemon, unlike the installed-only check above.
+        """
+        try:
+            if backend == "multipass":
+                self._run_command(["multipass", "version"])
+            elif backend == "lxd":
+                self._run_command(["lxc", "version"])
+            return True
+        except RuntimeError:
+            return False
+
+    def refresh_backends(self):
+        """Forget cached backend probes so they are re-checked on next use
+
+        Useful after the user installs multipass/lxd without restarting
+        the application.
+        """
+        self._backend_available.clear()
+    
+    def _invalidate_env_cache(self):
+        """Drop the cached environment list after a state-changing operation"""
+        self._env_cache = None
+        self._env_cache_ts = 0.0
+
+    def invalidate_cache(self):
+        """Drop the cached environment list
+
+        For callers that change environment state outside this manager,
+        e.g. the GUI streaming a multipass/lxc call through QProcess.
+        """
+        self._invalidate_env_cache()
+
+    def _find_env(self, name: str) -> Optional[Dict]:
+        """Find an environment by name, using the cached list when fresh"""
+        return next((e for e in self.list_environments() if e["name"] == name), None)
+
+    def list_environments(self) -> List[Dict]:
+        """List all environments from both backends"""
+        if (self._env_cache is not None
+                and time.monotonic() - self._env_cache_ts < self._env_cache_ttl):
+            return self._env_cache
+
+        # Read environments.json once per refresh instead of once per instance
+        env_config = self._load_environments_config()
+
+        # The two backends are independent daemons; query them in parallel
+        # so refresh latency is max(multipass, lxd) rather than their sum
+        mp_future = _POOL.submit(self._collect_multipass, env_config)
+        lxd_future = _POOL.submit(self._collect_lxd, env_config)
+        environments = mp_future.result() + lxd_future.result()
+
+        self._env_cache = environments
+        self._env_cache_ts = time.monotonic()
+        return environments
+
+    def _collect_multipass(self, env_config: Dict) -> List[Dict]:
+        """Collect environment entries from the Multipass backend"""
+        if not self._check_backend_available("multipass"):
+            return []
+
+        environments = []
+        try:
+            multipass_data = loads(self._run_command_bytes(["multipass", "list", "--format", "json"]))
+
+            # One `multipass info --all` covers every instance; avoids
+            # a subprocess spawn + JSON parse per instance for mounts
+            info_by_name = self._get_multipass_info_all()
+
+            for instance in multipass_data.get("list", []):
+                name = instance["name"]
+                env = {
+                    "name": name,
+                    "status": instance["state"].title(),
+                    "backend": "multipass",
+                    "ip": instance.get("ipv4", ["Not available"])[0] if instance.get("ipv4") else "Not available",
+                    "template": env_config.get(name, {}).get("template", "Unknown"),
+                    "mounts": self._extract_multipass_mounts(info_by_name.get(name, {}))
+                }
+                environments.append(env)
+
+        except (RuntimeError, JSONDecodeError, KeyError):
+            pass  # Skip if multipass is not available or fails
+
+        return environments
+
+    def _collect_lxd(self, env_config: Dict) -> List[Dict]:
+        """Collect environment entries from the LXD backend"""
+        if not self._check_backend_available("lxd"):
+            return []
+
+        environments = []
+        try:
+            lxd_data = loads(self._run_command_bytes(["lxc", "list", "--format", "json"]))
+
+            for container in lxd_data:
+                status = container["status"].title()
+
+                # First IPv4 address on a non-loopback interface
+                state = container.get("state") or {}
+                network = state.get("network") or {}
+                ip = next(
+                    (addr["address"]
+                     for interface, data in network.items() if interface != "lo"
+                     for addr in (data.get("addresses") or [])
+                     if addr.get("family") == "inet"),
+                    "Not available"
+                )
+
+                env = {
+                    "name": container["name"],
+                    "status": status,
+                    "backend": "lxd",
+                    "ip": ip,
+                    "template": env_config.get(container["name"], {}).get("template", "Unknown"),
+                    "mounts": self._extract_lxd_mounts(container)
+                }
+                environments.append(env)
+
+        except (RuntimeError, JSONDecodeError, KeyError):
+            pass  # Skip if lxd is not available or fails
+
+        return environments
+    
+    def _get_multipass_info_all(self) -> Dict:
+        """Get detailed info for all Multipass instances in one call"""
+        try:
+            info_data = loads(self._run_command_bytes(["multipass", "info", "--all", "--format", "json"]))
+            return info_data.get("info", {})
+        except (RuntimeError, JSONDecodeError, KeyError):
+            return {}
+
+    @staticmethod
+    def _extract_multipass_mounts(instance_info: Dict) -> List[Dict]:
+        """Extract mount information from an already-parsed info dict"""
+        return [
+            {"host": mount_data.get("source_path", "Unknown"), "guest": guest_path}
+            for guest_path, mount_data in instance_info.get("mounts", {}).items()
+        ]
+    
+    @staticmethod
+    def _extract_lxd_mounts(container: Dict) -> List[Dict]:
+        """Extract disk mounts from an already-parsed lxc list entry
+
+        `lxc list --format json` includes `expanded_devices`, so there is
+        no need to run `lxc config show` per container and parse its
+        YAML output by hand.
+        """
+        devices = container.get("expanded_devices") or {}
+        return [
+            {"host": dev["source"], "guest": dev["path"]}
+            for dev in devices.values()
+            if dev.get("type") == "disk" and "source" in dev and "path" in dev
+        ]
+    
+    def create_environment(self, config: Dict):
+        """Create a new environment"""
+        name = config["name"]
+        backend = config["backend"]
+        template_id = config["template"]
+        mounts = config.get("mounts", [])
+        resources = config.get("resources", {})
+        
+        if not name:
+            raise ValueError("Environment name is required")
+        
+        if not self._check_backend_available(backend):
+            raise RuntimeError(f"Backend {backend} is not available")
+        
+        # Get template configuration
+        try:
+            template = _templates_instance().get_template(template_id)
+        except KeyError:
+            raise ValueError(f"Template {template_id} not found")
+        
+        try:
+            if backend == "multipass":
+                self._create_multipass_environment(name, template, mounts, resources)
+            elif backend == "lxd":
+                self._create_lxd_environment(name, template, mounts, resources)
+            else:
+                raise ValueError(f"Unsupported backend: {backend}")
+            
+            # Save environment configuration
+            with self._registry_lock:
+                env_config = self._load_environments_config()
+                env_config[name] = {
+                    "template": template_id,
+                    "backend": backend,
+                    "created": True
+                }
+                self._save_environments_config(env_config)
+            self._invalidate_env_cache()
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to create environment: {e}")
+    
+    def _create_multipass_environment(self, name: str, template, mounts: List[Dict], resources: Dict):
+        """Create a Multipass environment"""
+        cmd = ["multipass", "launch"]
+        
+        # Add resource constraints
+        if resources.get("cpus"):
+            cmd.extend(["--cpus", str(resources["cpus"])])
+        if resources.get("memory"):
+            cmd.extend(["--memory", resources["memory"]])
+        if resources.get("disk"):
+            cmd.extend(["--disk", resources["disk"]])
+        
+        # Use the base image specified in template
+        base_image = template.base_image
+        cmd.extend([base_image, "--name", name])
+        
+        # Create the instance
+        self._run_command(cmd)
+        
+        # Wait for it to be ready
+        self._wait_cloud_init("multipass", name)
+        
+        # Set up directory mounts
+        for mount in mounts:
+            mount_cmd = ["multipass", "mount", mount["host"], f"{name}:{mount['guest']}"]
+            self._run_command(mount_cmd)
+        
+        # Install template packages and run setup script
+        self._setup_environment(name, template, "multipass")
+    
+    def _create_lxd_environment(self, name: str, template, mounts: List[Dict], resources: Dict):
+        """Create an LXD environment"""
+        # Launch container
+        base_image = template.base_image
+        cmd = ["lxc", "launch", base_image, name]
+        self._run_command(cmd)
+        
+        # Configure resources
+        if resources.get("cpus"):
+            self._run_command(["lxc", "config", "set", name, f"limits.cpu={resources['cpus']}"])
+        if resources.get("memory"):
+            self._run_command(["lxc", "config", "set", name, f"limits.memory={resources['memory']}"])
+        
+        # Wait for container to be ready
+        self._wait_cloud_init("lxd", name)
+        
+        # Set up directory mounts
+        for i, mount in enumerate(mounts):
+            device_name = f"mount{i}"
+            self._run_command([
+                "lxc", "config", "device", "add", name, device_name, "disk",
+                f"source={mount['host']}", f"path={mount['guest']}"
+            ])
+        
+        # Install template packages and run setup script
+        self._setup_environment(name, template, "lxd")
+    
+    def _wait_cloud_init(self, backend: str, name: str, timeout: float = 600):
+        """Wait for cloud-init to finish inside an environment
+
+        Polls a background `cloud-init status --wait` process instead of
+        blocking inside subprocess.run, so threads running several
+        creations can overlap their waits and callers can enforce a
+        timeout.
+        """
+        exec_cmd = ["multipass", "exec"] if backend == "multipass" else ["lxc", "exec"]
+        proc = self._run_command_async(exec_cmd + [name, "--", "cloud-init", "status", "--wait"])
+
+        deadline = time.monotonic() + timeout
+        while proc.poll() is None:
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise RuntimeError(f"Timed out waiting for cloud-init in '{name}'")
+            time.sleep(0.5)
+
+        if proc.returncode != 0:
+            stderr = proc.stderr.read() if proc.stderr else ""
+            raise RuntimeError(f"cloud-init failed in '{name}': {stderr}")
+
+    def _setup_environment(self, name: str, template, backend: str):
+        """Set up the environment with template packages and configuration"""
+        setup_script = template.setup_script
+        
+        if backend == "multipass":
+            exec_cmd = ["multipass", "exec", name, "--"]
+        elif backend == "lxd":
+            exec_cmd = ["lxc", "exec", name, "--"]
+        else:
+            raise ValueError(f"Unsupported backend: {backend}")
+        
+        # Update package list and install packages in one guest invocation;
+        # install_cmd is precomputed and shell-quoted on the template
+        if template.packages:
+            apt_script = "apt-get update && " + template.install_cmd
+        else:
+            apt_script = "apt-get update"
+        self._run_command(exec_cmd + ["bash", "-c", apt_script])
+
+        # Run the whole setup script in a single shell; `set -e` preserves
+        # the old fail-fast behaviour of running line by line
+        if setup_script:
+            # Scripts are canonicalized (dedented/stripped) at load time
+            self._run_command(exec_cmd + ["bash", "-c", "set -e\n" + setup_script])
+    
+    def create_environments(self, configs: List[Dict]):
+        """Create several environments concurrently
+
+        Launches every creation on its own pool so N environments take
+        roughly the slowest single bring-up (cloud-init dominated)
+        rather than the sum of all of them.
+        """
+        futures = [_CREATE_POOL.submit(self.create_environment, config)
+                   for config in configs]
+
+        errors = []
+        for config, future in zip(configs, futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(f"{config.get('name', '?')}: {e}")
+
+        if errors:
+            raise RuntimeError("Failed to create environments:\n" + "\n".join(errors))
+
+    def start_environment(self, name: str):
+        """Start an environment"""
+        env = self._find_env(name)
+
+        if not env:
+            raise RuntimeError(f"Environment '{name}' not found")
+        
+        if env["status"] == "Running":
+            return  # Already running
+        
+        backend = env["backend"]
+        
+        try:
+            if backend == "multipass":
+                self._run_command(["multipass", "start", name])
+            elif backend == "lxd":
+                self._run_command(["lxc", "start", name])
+            self._invalidate_env_cache()
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to start environment: {e}")
+    
+    def stop_environment(self, name: str):
+        """Stop an environment"""
+        env = self._find_env(name)
+
+        if not env:
+            raise RuntimeError(f"Environment '{name}' not found")
+        
+        if env["status"] == "Stopped":
+            return  # Already stopped
+        
+        backend = env["backend"]
+        
+        try:
+            if backend == "multipass":
+                self._run_command(["multipass", "stop", name])
+            elif backend == "lxd":
+                self._run_command(["lxc", "stop", name])
+            self._invalidate_env_cache()
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to stop environment: {e}")
+    
+    def delete_environment(self, name: str):
+        """Delete an environment"""
+        env = self._find_env(name)
+
+        if not env:
+            raise RuntimeError(f"Environment '{name}' not found")
+        
+        backend = env["backend"]
+        
+        try:
+            if backend == "multipass":
+                # Stop first if running
+                if env["status"] == "Running":
+                    self._run_command(["multipass", "stop", name])
+                self._run_command(["multipass", "delete", name])
+                self._run_command(["multipass", "purge"])
+            elif backend == "lxd":
+                # Stop first if running
+                if env["status"] == "Running":
+                    self._run_command(["lxc", "stop", name])
+                self._run_command(["lxc", "delete", name])
+            
+            self._invalidate_env_cache()
+
+            # Remove from configuration
+            with self._registry_lock:
+                env_config = self._load_environments_config()
+                if name in env_config:
+                    del env_config[name]
+                    self._save_environments_config(env_config)
+                
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to delete environment: {e}")
+    
+    def _detect_terminal(self) -> List[str]:
+        """Find a usable terminal emulator command, caching the result
+
+        Honours the configured terminal_emulator preference when it is
+        not "auto", then falls back to probing the known emulators with
+        shutil.which — a pure path lookup, no subprocess spawns.
+        """
+        if self._terminal_cmd is not None:
+            return self._terminal_cmd
+
+        from .config_manager import ConfigManager
+        preferred = ConfigManager().get_terminal_preference()
+        if preferred != "auto":
+            cmd = _TERMINAL_COMMANDS.get(preferred)
+            if cmd and shutil.which(cmd[0]):
+                self._terminal_cmd = cmd
+                return cmd
+
+        for cmd in _TERMINAL_COMMANDS.values():
+            if shutil.which(cmd[0]):
+                self._terminal_cmd = cmd
+                return cmd
+
+        raise RuntimeError("No suitable terminal emulator found")
+
+    def open_shell(self, name: str):
+        """Open a shell to an environment"""
+        env = self._find_env(name)
+
+        if not env:
+            raise RuntimeError(f"Environment '{name}' not found")
+        
+        if env["status"] != "Running":
+            raise RuntimeError(f"Environment '{name}' is not running")
+        
+        backend = env["backend"]
+        
+        try:
+            # Open in a new terminal window
+            terminal_cmd = self._detect_terminal()
+
+            if backend == "multipass":
+                shell_cmd = f"multipass shell {name}"
+            elif backend == "lxd":
+                shell_cmd = f"lxc exec {name} -- /bin/bash"
+            
+            # Execute in background
+            full_cmd = terminal_cmd + [f"{shell_cmd}; exec bash"]
+            subprocess.Popen(full_cmd, start_new_session=True)
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to open shell: {e}")
+    
+    def get_environment_info(self, name: str) -> Dict:
+        """Get detailed information about an environment"""
+        env = self._find_env(name)
+
+        if not env:
+            raise RuntimeError(f"Environment '{name}' not found")
+        
+        backend = env["backend"]
+        
+        try:
+            if backend == "multipass":
+                info_data = loads(self._run_command_bytes(["multipass", "info", name, "--format", "json"]))
+                return info_data.get("info", {}).get(name, {})
+            elif backend == "lxd":
+                result = self._run_command(["lxc", "info", name])
+                # Parse the output (simplified)
+                return {"raw_info": result.stdout}
+        except (RuntimeError, JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to get environment info: {e}")
@@ -0,0 +1,41 @@
+"""
+JSON Utilities - orjson-backed serialization with a stdlib fallback
+
+orjson parses roughly 3x faster and serializes up to 10x faster than the
+stdlib json module, and it operates directly on UTF-8 bytes. All config and
+subprocess-output JSON handling goes through these helpers so the whole
+application benefits when orjson is installed, while remaining fully
+functional without it.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode errors from both backends derive from ValueError, so callers can
+# catch this regardless of which implementation is active.
+JSONDecodeError = json.JSONDecodeError if orjson is None else orjson.JSONDecodeError
+
+
+def loads(data):
+    """Parse JSON from a str or bytes payload"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps_pretty(obj) -> bytes:
+    """Serialize to human-readable (2-space indented) JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
@@ -0,0 +1,1075 @@
+#!/usr/bin/env python3
+"""
+Ubuntu Desktop Development Environment Manager
+A GUI tool for managing isolated development environments using Multipass/LXD
+"""
+
+import sys
+from functools import partial
+
+# Explicit imports instead of wildcards: each `import *` forces Python to
+# bind every symbol in the module (hundreds per Qt module) at startup and
+# defeats import-time dead-code analysis by tools.
+try:
+    from PyQt5.QtWidgets import (
+        QAction, QApplication, QComboBox, QDialog, QFileDialog, QFormLayout,
+        QGroupBox, QHBoxLayout, QLabel, QLineEdit, QListView, QListWidget,
+        QListWidgetItem, QMainWindow, QMessageBox, QPlainTextEdit,
+        QPushButton, QRadioButton, QSpinBox, QVBoxLayout, QWidget,
+    )
+    from PyQt5.QtCore import (
+        QAbstractListModel, QDateTime, QModelIndex, QProcess, QRunnable,
+        Qt, QThreadPool, QTimer, pyqtSignal,
+    )
+    from PyQt5.QtGui import QFont, QIcon, QPixmapCache
+except ImportError:
+    print("PyQt5 not found. Please install it with: pip install PyQt5")
+    sys.exit(1)
+
+from .environment_manager import EnvironmentManager
+from .templates import EnvironmentTemplates
+from .config_manager import ConfigManager
+
+# Backend choices in combo-box order; index lookups against this tuple
+# avoid round-tripping the displayed text through Qt on every read
+_BACKENDS = ("multipass", "lxd")
+
+# Static about-dialog body; built once at import instead of per showing
+_ABOUT_HTML = """
+<h3>Ubuntu Development Environment Manager</h3>
+<p>A GUI tool for managing isolated development environments using Multipass/LXD</p>
+<p><b>Version:</b> 1.0.0</p>
+<p><b>Features:</b></p>
+<ul>
+    <li>Create isolated development environments</li>
+    <li>Pre-configured templates for popular languages</li>
+    <li>Host directory mounting</li>
+    <li>Easy environment management</li>
+</ul>
+<p><b>Built for:</b> Ubuntu Desktop Developers</p>
+"""
+
+# One application-wide stylesheet, applied once at startup. Qt parses QSS
+# and rebuilds the widget's style engine on every setStyleSheet call, so
+# scattering per-widget styles repeats that work for each styled widget;
+# selectors on object names keep a single parse for the whole app.
+_APP_STYLE = """
+QPushButton#primary {
+    background-color: #4CAF50;
+    color: white;
+    padding: 8px;
+}
+QPushButton#danger {
+    background-color: #f44336;
+    color: white;
+    padding: 8px;
+}
+QLabel#panelTitle {
+    font-size: 16px;
+    font-weight: bold;
+    margin: 10px;
+}
+QLabel#templateDesc {
+    color: #666;
+    font-style: italic;
+    margin: 5px;
+}
+"""
+
+
+class RefreshRunnable(QRunnable):
+    """Fetch the environment list on the pool and hand it back via signal"""
+
+    def __init__(self, fn, done_signal, fail_signal):
+        super().__init__()
+        self._fn = fn
+        self._done = done_signal
+        self._fail = fail_signal
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._fail.emit(str(e))
+        else:
+            self._done.emit(result)
+
+
+class EnvOpRunnable(QRunnable):
+    """Run a blocking EnvironmentManager operation on the shared thread pool
+
+    Emits through signals owned by the main window rather than a
+    per-operation QObject; see DevEnvironmentGUI's class-level signals.
+    """
+
+    def __init__(self, fn, name, error_prefix, done_signal, fail_signal, *args):
+        super().__init__()
+        self._fn = fn
+        self._name = name
+        self._error_prefix = error_prefix
+        self._done = done_signal
+        self._fail = fail_signal
+        self._args = args or (name,)
+
+    def run(self):
+        try:
+            self._fn(*self._args)
+        except Exception as e:
+            self._fail.emit(f"{self._error_prefix}: {e}")
+        else:
+            self._done.emit(self._name)
+
+
+class EnvListModel(QAbstractListModel):
+    """List model over the environment dicts
+
+    A model-backed QListView hands the view lightweight indexes on demand
+    instead of allocating a QListWidgetItem (plus its data map) per
+    environment, and updates are expressed as row operations so the view
+    repaints only the rows that actually changed.
+    """
+
+    def __init__(self, icon_provider, parent=None):
+        super().__init__(parent)
+        self._envs = []
+        self._icon_provider = icon_provider
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._envs)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._envs):
+            return None
+
+        env = self._envs[index.row()]
+        if role == Qt.DisplayRole:
+            return env['name']
+        if role == Qt.DecorationRole:
+            return self._icon_provider(env['status'])
+        if role == Qt.UserRole:
+            return env
+        return None
+
+    def env_at(self, index):
+        """Return the environment dict at an index, or None"""
+        if index.isValid() and 0 <= index.row() < len(self._envs):
+            return self._envs[index.row()]
+        return None
+
+    def set_environments(self, environments):
+        """Diff a fresh environment list against the current rows
+
+        Rows are keyed by (backend, name): names are only unique within a
+        backend, and a multipass and an lxd environment sharing a name
+        must stay two distinct rows.
+        """
+        new_envs = {(env['backend'], env['name']): env for env in environments}
+
+        # Drop rows whose environment disappeared; walk backwards so row
+        # numbers stay valid while removing
+        for row in range(len(self._envs) - 1, -1, -1):
+            env = self._envs[row]
+            if (env['backend'], env['name']) not in new_envs:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._envs[row]
+                self.endRemoveRows()
+
+        # Update changed rows in place, collect genuinely new ones
+        row_by_key = {(env['backend'], env['name']): row
+                      for row, env in enumerate(self._envs)}
+        added = []
+        for key, env in new_envs.items():
+            row = row_by_key.get(key)
+            if row is None:
+                added.append(env)
+            elif self._envs[row] != env:
+                self._envs[row] = env
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx)
+
+        if added:
+            first = len(self._envs)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._envs.extend(added)
+            self.endInsertRows()
+
+
+class DevEnvironmentGUI(QMainWindow):
+    # Completion signals for pooled operations. Class-level and connected
+    # once with queued connections, so worker threads emit straight into
+    # the GUI thread without allocating a signal holder per operation.
+    env_created = pyqtSignal(str)
+    env_deleted = pyqtSignal(str)
+    env_failed = pyqtSignal(str)
+    env_list_ready = pyqtSignal(object)
+    refresh_failed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        # Constructed lazily in _deferred_init so backend probing doesn't
+        # delay the first paint of the window
+        self.env_manager = None
+        self.templates = EnvironmentTemplates()
+        self.config = ConfigManager()
+
+        # Theme icon lookups walk the icon theme index; resolve the three
+        # status icons once instead of per item per refresh
+        self._icon_running = QIcon.fromTheme("media-playback-start")
+        self._icon_stopped = QIcon.fromTheme("media-playback-pause")
+        self._icon_unknown = QIcon.fromTheme("dialog-question")
+
+        # Bounded pool for blocking backend operations; reusing pooled
+        # threads avoids paying thread creation on every button click
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(4)
+        self.env_created.connect(self.on_environment_created, Qt.QueuedConnection)
+        self.env_deleted.connect(self.on_environment_deleted, Qt.QueuedConnection)
+        self.env_failed.connect(self.on_environment_error, Qt.QueuedConnection)
+        self.env_list_ready.connect(self._apply_environment_list, Qt.QueuedConnection)
+        self.refresh_failed.connect(self._on_refresh_failed, Qt.QueuedConnection)
+        # In-flight QProcess operations keyed by (backend CLI, env name)
+        self._procs = {}
+        # Guards against piling up concurrent refreshes; a trigger that
+        # lands mid-fetch is remembered and replayed when the fetch ends
+        self._refresh_inflight = False
+        self._refresh_pending = False
+        # Coalesces refresh triggers: operations that complete close
+        # together (or users hammering Refresh) cause one backend scan
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Log lines are buffered and flushed on a short timer so bursts of
+        # output (streamed process logs, refreshes) cost one document edit
+        # and one relayout instead of one per line
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        # Last message shown in the status bar, to skip no-op repaints
+        self._last_status = None
+        # Dialogs are built once on first use and reused; constructing
+        # their widget trees per invocation is the expensive part
+        self._create_dialog = None
+        self._settings_dialog = None
+
+        self.setWindowTitle("Ubuntu Development Environment Manager")
+        self.setGeometry(100, 100, 1000, 700)
+        # The application icon was already resolved in main(); reuse it
+        # rather than walking the icon theme again
+        self.setWindowIcon(QApplication.instance().windowIcon())
+        
+        self.init_ui()
+        # Show the window first; build the manager and run the initial
+        # backend scan once the event loop is idle
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self):
+        """Finish startup work deferred until after the window is shown"""
+        self.env_manager = EnvironmentManager()
+        self.refresh_environments()
+
+    def init_ui(self):
+        """Initialize the user interface"""
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Main layout
+        main_layout = QHBoxLayout(central_widget)
+        
+        # Left panel - Environment list and controls
+        left_panel = self.create_left_panel()
+        main_layout.addWidget(left_panel, 1)
+        
+        # Right panel - Environment details and logs
+        right_panel = self.create_right_panel()
+        main_layout.addWidget(right_panel, 2)
+        
+        # Status bar
+        self.statusBar().showMessage("Ready")
+        
+        # Menu bar
+        self.create_menu_bar()
+        
+    def create_left_panel(self):
+        """Create the left panel with environment list and controls"""
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        
+        # Title
+        title = QLabel("Development Environments")
+        title.setObjectName("panelTitle")
+        layout.addWidget(title)
+        
+        # Environment list: a QListView over EnvListModel, so rows are
+        # plain dicts in the model rather than per-row widget items
+        self.env_model = EnvListModel(self._status_icon, self)
+        self.env_list = QListView()
+        self.env_list.setModel(self.env_model)
+        self.env_list.setEditTriggers(QListView.NoEditTriggers)
+        self.env_list.selectionModel().selectionChanged.connect(
+            self.on_environment_selected)
+        layout.addWidget(self.env_list)
+        
+        # Control buttons
+        button_layout = QVBoxLayout()
+        
+        self.create_btn = QPushButton("Create Environment")
+        self.create_btn.clicked.connect(self.create_environment_dialog)
+        self.create_btn.setObjectName("primary")
+        button_layout.addWidget(self.create_btn)
+        
+        self.start_btn = QPushButton("Start")
+        self.start_btn.clicked.connect(self.start_environment)
+        self.start_btn.setEnabled(False)
+        button_layout.addWidget(self.start_btn)
+        
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.clicked.connect(self.stop_environment)
+        self.stop_btn.setEnabled(False)
+        button_layout.addWidget(self.stop_btn)
+        
+        self.shell_btn = QPushButton("Open Shell")
+        self.shell_btn.clicked.connect(self.open_shell)
+        self.shell_btn.setEnabled(False)
+        button_layout.addWidget(self.shell_btn)
+        
+        self.delete_btn = QPushButton("Delete")
+        self.delete_btn.clicked.connect(self.delete_environment)
+        self.delete_btn.setEnabled(False)
+        self.delete_btn.setObjectName("danger")
+        button_layout.addWidget(self.delete_btn)
+        
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        
+        return panel
+        
+    def create_right_panel(self):
+        """Create the right panel with environment details and logs"""
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        
+        # Environment details
+        details_group = QGroupBox("Environment Details")
+        details_layout = QFormLayout(details_group)
+        
+        self.name_label = QLabel("-")
+        self.status_label = QLabel("-")
+        self.template_label = QLabel("-")
+        self.ip_label = QLabel("-")
+        self.mounts_label = QLabel("-")
+        
+        details_layout.addRow("Name:", self.name_label)
+        details_layout.addRow("Status:", self.status_label)
+        details_layout.addRow("Template:", self.template_label)
+        details_layout.addRow("IP Address:", self.ip_label)
+        details_layout.addRow("Mounts:", self.mounts_label)
+        
+        layout.addWidget(details_group)
+        
+        # Logs
+        logs_group = QGroupBox("Logs")
+        logs_layout = QVBoxLayout(logs_group)
+        
+        # QPlainTextEdit lays out plain text line by line instead of
+        # running QTextEdit's rich-text engine over the whole document
+        self.log_text = QPlainTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setFont(QFont("Consolas", 9))
+        # Cap the backlog so long sessions don't grow the document (and
+        # its layout cost) without bound
+        self.log_text.setMaximumBlockCount(5000)
+        logs_layout.addWidget(self.log_text)
+        
+        # Log controls
+        log_controls = QHBoxLayout()
+        self.clear_logs_btn = QPushButton("Clear Logs")
+        self.clear_logs_btn.clicked.connect(self.clear_logs)
+        log_controls.addWidget(self.clear_logs_btn)
+        log_controls.addStretch()
+        logs_layout.addLayout(log_controls)
+        
+        layout.addWidget(logs_group)
+        
+        return panel
+        
+    def create_menu_bar(self):
+        """Create the menu bar"""
+        menubar = self.menuBar()
+        
+        # File menu
+        file_menu = menubar.addMenu('File')
+        
+        refresh_action = QAction('Refresh', self)
+        refresh_action.triggered.connect(self.refresh_environments)
+        file_menu.addAction(refresh_action)
+        
+        file_menu.addSeparator()
+        
+        exit_action = QAction('Exit', self)
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
+        
+        # Tools menu
+        tools_menu = menubar.addMenu('Tools')
+        
+        settings_action = QAction('Settings', self)
+        settings_action.triggered.connect(self.open_settings)
+        tools_menu.addAction(settings_action)
+        
+        # Help menu
+        help_menu = menubar.addMenu('Help')
+        
+        about_action = QAction('About', self)
+        about_action.triggered.connect(self.show_about)
+        help_menu.addAction(about_action)
+        
+    def _status_icon(self, status):
+        """Return the cached icon for an environment status"""
+        if status == 'Running':
+            return self._icon_running
+        elif status == 'Stopped':
+            return self._icon_stopped
+        return self._icon_unknown
+
+    def refresh_environments(self):
+        """Request a refresh of the environment list
+
+        Debounced: restarting the single-shot timer folds triggers that
+        arrive within 200ms into one backend scan.
+        """
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Run the debounced refresh without blocking the GUI
+
+        The backend scan (multipass list, lxc list, metadata batches) can
+        take hundreds of milliseconds; run it on the pool and apply the
+        result to the widget when it arrives.
+        """
+        if self._refresh_inflight:
+            # The in-flight fetch may predate whatever prompted this
+            # trigger (e.g. a cache invalidation); rerun once it lands
+            # instead of silently serving stale data
+            self._refresh_pending = True
+            return
+
+        self._refresh_inflight = True
+        self.log("Refreshing environment list...")
+        self.pool.start(RefreshRunnable(self._fetch_environments,
+                                        self.env_list_ready, self.refresh_failed))
+
+    def _fetch_environments(self):
+        """Pool-side fetch: list environments and precompute display text
+
+        The mounts column is rendered on every selection change; format it
+        once here, off the GUI thread, instead of per click.
+        """
+        environments = self.env_manager.list_environments()
+        for env in environments:
+            mounts = env.get('mounts', [])
+            env['_mounts_text'] = '\n'.join(
+                f"{m['host']} → {m['guest']}" for m in mounts) if mounts else "None"
+        return environments
+
+    def _on_refresh_failed(self, error):
+        """Handle a failed environment refresh"""
+        self._refresh_inflight = False
+        self._restart_pending_refresh()
+        self.log(f"Error refreshing environments: {error}")
+        QMessageBox.warning(self, "Error", f"Failed to refresh environments:\n{error}")
+
+    def _restart_pending_refresh(self):
+        """Replay a refresh trigger that arrived during the last fetch"""
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_timer.start()
+
+    def _apply_environment_list(self, environments):
+        """Apply a freshly fetched environment list to the model"""
+        self._refresh_inflight = False
+        self._restart_pending_refresh()
+
+        # Hold selection signals while the model diffs itself; removed
+        # rows would otherwise fire a selection change per removal
+        selection = self.env_list.selectionModel()
+        selection.blockSignals(True)
+        try:
+            self.env_model.set_environments(environments)
+        finally:
+            selection.blockSignals(False)
+
+        # Re-apply selection-dependent state; the selected row's status
+        # may have changed while signals were blocked
+        self.on_environment_selected()
+        self.log(f"Found {len(environments)} environments")
+
+    def on_environment_selected(self):
+        """Handle environment selection"""
+        env_data = self.env_model.env_at(self.env_list.currentIndex())
+        if env_data:
+            self.update_environment_details(env_data)
+            
+            # Enable/disable buttons based on status
+            is_running = env_data['status'] == 'Running'
+            is_stopped = env_data['status'] == 'Stopped'
+            
+            self.start_btn.setEnabled(is_stopped)
+            self.stop_btn.setEnabled(is_running)
+            self.shell_btn.setEnabled(is_running)
+            self.delete_btn.setEnabled(is_stopped)
+        else:
+            self.clear_environment_details()
+            self.start_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            self.shell_btn.setEnabled(False)
+            self.delete_btn.setEnabled(False)
+            
+    def update_environment_details(self, env_data):
+        """Update the environment details panel"""
+        self.name_label.setText(env_data['name'])
+        self.status_label.setText(env_data['status'])
+        self.template_label.setText(env_data.get('template', 'Unknown'))
+        self.ip_label.setText(env_data.get('ip', 'Not available'))
+        self.mounts_label.setText(env_data.get('_mounts_text', 'None'))
+        
+    def clear_environment_details(self):
+        """Clear the environment details panel"""
+        for label in [self.name_label, self.status_label, self.template_label, 
+                     self.ip_label, self.mounts_label]:
+            label.setText("-")
+            
+    def create_environment_dialog(self):
+        """Open the create environment dialog"""
+        if self._create_dialog is None:
+            self._create_dialog = CreateEnvironmentDialog(
+                self.templates, self.config, self)
+        else:
+            self._create_dialog.reset()
+
+        if self._create_dialog.exec_() == QDialog.Accepted:
+            env_config = self._create_dialog.get_config()
+            self.create_environment(env_config)
+            
+    def create_environment(self, config):
+        """Create a new environment"""
+        self.log(f"Creating environment '{config['name']}'...")
+        self.create_btn.setEnabled(False)
+
+        self._start_operation(self.env_manager.create_environment,
+                              config['name'], "Creation failed",
+                              self.env_created, config)
+
+    def _start_operation(self, fn, name, error_prefix, done_signal, *args):
+        """Dispatch a blocking operation to the pool"""
+        self.pool.start(EnvOpRunnable(fn, name, error_prefix,
+                                      done_signal, self.env_failed, *args))
+
+    def _stream_operation(self, name, program, args, error_prefix, on_finished):
+        """Run a single CLI operation via QProcess, streaming output to the log
+
+        No worker thread and no polling: stdout/stderr arrive through Qt
+        signals and feed the log as the backend produces them. One process
+        per (backend, environment) pair, so concurrent operations don't
+        collide — including same-named environments on different backends.
+        """
+        key = (program, name)
+        if key in self._procs:
+            self.log(f"An operation is already running for '{name}'")
+            return
+
+        proc = QProcess(self)
+        proc.setProcessChannelMode(QProcess.MergedChannels)
+        proc.readyReadStandardOutput.connect(partial(self._on_proc_output, proc))
+        proc.finished.connect(
+            partial(self._on_proc_finished, key, error_prefix, on_finished))
+        self._procs[key] = proc
+        proc.start(program, args)
+
+    def _on_proc_output(self, proc):
+        """Forward a QProcess's pending output to the log"""
+        data = bytes(proc.readAllStandardOutput()).decode('utf-8', errors='replace')
+        for line in data.splitlines():
+            if line.strip():
+                self.log(line.strip())
+
+    def _on_proc_finished(self, key, error_prefix, on_finished, exit_code, exit_status):
+        """Handle completion of a streamed CLI operation"""
+        proc = self._procs.pop(key, None)
+        if proc is not None:
+            proc.deleteLater()
+
+        self.env_manager.invalidate_cache()
+
+        if exit_status == QProcess.NormalExit and exit_code == 0:
+            on_finished(key[1])
+        else:
+            self.on_environment_error(f"{error_prefix}: exit code {exit_code}")
+
+    def on_environment_created(self, name):
+        """Handle successful environment creation"""
+        self.log(f"Environment '{name}' created successfully")
+        self.create_btn.setEnabled(True)
+        self.refresh_environments()
+        
+    def on_environment_error(self, error_msg):
+        """Handle environment operation error"""
+        self.log(error_msg)
+        self.create_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", error_msg)
+        
+    def start_environment(self):
+        """Start the selected environment"""
+        env_data = self.env_model.env_at(self.env_list.currentIndex())
+        if env_data:
+            name = env_data['name']
+            self.log(f"Starting environment '{name}'...")
+            program = "multipass" if env_data['backend'] == "multipass" else "lxc"
+            self._stream_operation(name, program, ["start", name],
+                                   "Start failed", self.on_environment_started)
+            
+    def on_environment_started(self, name):
+        """Handle successful environment start"""
+        self.log(f"Environment '{name}' started successfully")
+        self.refresh_environments()
+        
+    def stop_environment(self):
+        """Stop the selected environment"""
+        env_data = self.env_model.env_at(self.env_list.currentIndex())
+        if env_data:
+            name = env_data['name']
+            self.log(f"Stopping environment '{name}'...")
+            program = "multipass" if env_data['backend'] == "multipass" else "lxc"
+            self._stream_operation(name, program, ["stop", name],
+                                   "Stop failed", self.on_environment_stopped)
+            
+    def on_environment_stopped(self, name):
+        """Handle successful environment stop"""
+        self.log(f"Environment '{name}' stopped successfully")
+        self.refresh_environments()
+        
+    def delete_environment(self):
+        """Delete the selected environment"""
+        env_data = self.env_model.env_at(self.env_list.currentIndex())
+        if env_data:
+            reply = QMessageBox.question(
+                self, 
+                "Confirm Deletion", 
+                f"Are you sure you want to delete environment '{env_data['name']}'?\n\nThis action cannot be undone.",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            
+            if reply == QMessageBox.Yes:
+                self.log(f"Deleting environment '{env_data['name']}'...")
+                self._start_operation(self.env_manager.delete_environment,
+                                      env_data['name'], "Delete failed",
+                                      self.env_deleted)
+                
+    def on_environment_deleted(self, name):
+        """Handle successful environment deletion"""
+        self.log(f"Environment '{name}' deleted successfully")
+        self.refresh_environments()
+        
+    def open_shell(self):
+        """Open a shell to the selected environment"""
+        env_data = self.env_model.env_at(self.env_list.currentIndex())
+        if env_data:
+            try:
+                self.env_manager.open_shell(env_data['name'])
+                self.log(f"Opened shell for environment '{env_data['name']}'")
+            except Exception as e:
+                self.log(f"Failed to open shell: {str(e)}")
+                QMessageBox.warning(self, "Error", f"Failed to open shell:\n{str(e)}")
+                
+    def open_settings(self):
+        """Open the settings dialog"""
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.config, self)
+        else:
+            self._settings_dialog.reload()
+        self._settings_dialog.exec_()
+        
+    def show_about(self):
+        """Show the about dialog"""
+        QMessageBox.about(
+            self,
+            "About Ubuntu Development Environment Manager",
+            _ABOUT_HTML
+        )
+        
+    def log(self, message):
+        """Add a message to the log"""
+        timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
+        self._log_buf.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+        if message != self._last_status:
+            self._last_status = message
+            self.statusBar().showMessage(message)
+
+    def _flush_log(self):
+        """Append all buffered log lines in a single document edit"""
+        if self._log_buf:
+            self.log_text.appendPlainText('\n'.join(self._log_buf))
+            self._log_buf.clear()
+
+    def clear_logs(self):
+        """Clear the log text"""
+        self._log_buf.clear()
+        self.log_text.clear()
+
+
+class CreateEnvironmentDialog(QDialog):
+    def __init__(self, templates, config, parent=None):
+        super().__init__(parent)
+        self.templates = templates
+        # Snapshot the templates once; the combo box and the description
+        # label both read from this instead of re-querying per signal
+        self._template_cache = templates.get_all_templates()
+        self.config = config
+        self.setWindowTitle("Create New Environment")
+        self.setModal(True)
+        self.resize(600, 500)
+        self.init_ui()
+        
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        
+        # Basic settings
+        basic_group = QGroupBox("Basic Settings")
+        basic_layout = QFormLayout(basic_group)
+        
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Enter environment name")
+        basic_layout.addRow("Name:", self.name_edit)
+        
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(_BACKENDS)
+        self.backend_combo.currentIndexChanged.connect(self.on_backend_changed)
+        basic_layout.addRow("Backend:", self.backend_combo)
+        
+        layout.addWidget(basic_group)
+        
+        # Template selection
+        template_group = QGroupBox("Template")
+        template_layout = QVBoxLayout(template_group)
+        
+        self.template_combo = QComboBox()
+        self.populate_templates()
+        self.template_combo.currentIndexChanged.connect(self.on_template_changed)
+        template_layout.addWidget(self.template_combo)
+        
+        self.template_desc = QLabel()
+        self.template_desc.setWordWrap(True)
+        self.template_desc.setObjectName("templateDesc")
+        template_layout.addWidget(self.template_desc)
+        
+        layout.addWidget(template_group)
+        
+        # Directory mounts
+        mounts_group = QGroupBox("Directory Mounts")
+        mounts_layout = QVBoxLayout(mounts_group)
+        
+        self.mounts_list = QListWidget()
+        mounts_layout.addWidget(self.mounts_list)
+        
+        mount_controls = QHBoxLayout()
+        self.add_mount_btn = QPushButton("Add Mount")
+        self.add_mount_btn.clicked.connect(self.add_mount)
+        mount_controls.addWidget(self.add_mount_btn)
+        
+        self.remove_mount_btn = QPushButton("Remove Mount")
+        self.remove_mount_btn.clicked.connect(self.remove_mount)
+        mount_controls.addWidget(self.remove_mount_btn)
+        
+        mount_controls.addStretch()
+        mounts_layout.addLayout(mount_controls)
+        
+        layout.addWidget(mounts_group)
+        
+        # Resource settings
+        resources_group = QGroupBox("Resources")
+        resources_layout = QFormLayout(resources_group)
+        
+        self.cpu_spin = QSpinBox()
+        self.cpu_spin.setRange(1, 16)
+        self.cpu_spin.setValue(2)
+        resources_layout.addRow("CPUs:", self.cpu_spin)
+        
+        self.memory_spin = QSpinBox()
+        self.memory_spin.setRange(512, 16384)
+        self.memory_spin.setValue(2048)
+        self.memory_spin.setSuffix(" MB")
+        resources_layout.addRow("Memory:", self.memory_spin)
+        
+        self.disk_spin = QSpinBox()
+        self.disk_spin.setRange(5, 100)
+        self.disk_spin.setValue(10)
+        self.disk_spin.setSuffix(" GB")
+        resources_layout.addRow("Disk:", self.disk_spin)
+        
+        layout.addWidget(resources_group)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        
+        create_btn = QPushButton("Create")
+        create_btn.setDefault(True)
+        create_btn.clicked.connect(self.accept)
+        create_btn.setObjectName("primary")
+        button_layout.addWidget(create_btn)
+        
+        layout.addLayout(button_layout)
+        
+        # Set initial template description
+        self.on_template_changed()
+        
+    def reset(self):
+        """Return the reused dialog to its initial state"""
+        self.name_edit.clear()
+        self.backend_combo.setCurrentIndex(0)
+        self.template_combo.setCurrentIndex(0)
+        self.mounts_list.clear()
+        self.cpu_spin.setValue(2)
+        self.memory_spin.setValue(2048)
+        self.disk_spin.setValue(10)
+
+    def populate_templates(self):
+        """Populate the template combo box"""
+        for template_id, template in self._template_cache.items():
+            self.template_combo.addItem(template.name, template_id)
+            
+    def on_backend_changed(self, index):
+        """Handle backend selection change"""
+        backend = _BACKENDS[index]
+        # Update available templates or settings based on backend
+        pass
+        
+    def on_template_changed(self):
+        """Handle template selection change"""
+        template_id = self.template_combo.currentData()
+        if template_id:
+            template = self._template_cache.get(template_id)
+            if template:
+                description = template.description
+                # setText triggers a relayout even for identical text
+                if description != self.template_desc.text():
+                    self.template_desc.setText(description)
+                
+    def add_mount(self):
+        """Add a directory mount"""
+        dialog = AddMountDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            host_path, guest_path = dialog.get_paths()
+            mount_text = f"{host_path} → {guest_path}"
+            
+            item = QListWidgetItem(mount_text)
+            item.setData(Qt.UserRole, {'host': host_path, 'guest': guest_path})
+            self.mounts_list.addItem(item)
+            
+    def remove_mount(self):
+        """Remove selected directory mount"""
+        current_row = self.mounts_list.currentRow()
+        if current_row >= 0:
+            self.mounts_list.takeItem(current_row)
+            
+    def get_config(self):
+        """Get the environment configuration"""
+        mounts = []
+        for i in range(self.mounts_list.count()):
+            item = self.mounts_list.item(i)
+            mounts.append(item.data(Qt.UserRole))
+            
+        return {
+            'name': self.name_edit.text().strip(),
+            'backend': _BACKENDS[self.backend_combo.currentIndex()],
+            'template': self.template_combo.currentData(),
+            'mounts': mounts,
+            'resources': {
+                'cpus': self.cpu_spin.value(),
+                'memory': f"{self.memory_spin.value()}M",
+                'disk': f"{self.disk_spin.value()}G"
+            }
+        }
+
+
+class AddMountDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Add Directory Mount")
+        self.setModal(True)
+        self.resize(500, 150)
+        self.init_ui()
+        
+    def init_ui(self):
+        layout = QFormLayout(self)
+        
+        # Host path
+        host_layout = QHBoxLayout()
+        self.host_edit = QLineEdit()
+        host_layout.addWidget(self.host_edit)
+        
+        host_browse_btn = QPushButton("Browse")
+        host_browse_btn.clicked.connect(self.browse_host_path)
+        host_layout.addWidget(host_browse_btn)
+        
+        layout.addRow("Host Path:", host_layout)
+        
+        # Guest path
+        self.guest_edit = QLineEdit()
+        self.guest_edit.setPlaceholderText("/home/ubuntu/project")
+        layout.addRow("Guest Path:", self.guest_edit)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        
+        ok_btn = QPushButton("OK")
+        ok_btn.setDefault(True)
+        ok_btn.clicked.connect(self.accept)
+        button_layout.addWidget(ok_btn)
+        
+        layout.addRow(button_layout)
+        
+    def browse_host_path(self):
+        """Browse for host directory"""
+        # ShowDirsOnly skips listing files entirely and DontResolveSymlinks
+        # avoids a stat per symlinked entry while browsing large trees
+        path = QFileDialog.getExistingDirectory(
+            self, "Select Host Directory", "",
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks)
+        if path:
+            self.host_edit.setText(path)
+            
+            # Auto-suggest guest path
+            if not self.guest_edit.text():
+                dir_name = path.rpartition('/')[2]
+                self.guest_edit.setText(f"/home/ubuntu/{dir_name}")
+                
+    def get_paths(self):
+        """Get the host and guest paths"""
+        return self.host_edit.text().strip(), self.guest_edit.text().strip()
+
+
+class SettingsDialog(QDialog):
+    def __init__(self, config, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.setWindowTitle("Settings")
+        self.setModal(True)
+        self.resize(400, 300)
+        self.init_ui()
+        
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Default backend
+        backend_group = QGroupBox("Default Backend")
+        backend_layout = QVBoxLayout(backend_group)
+        
+        self.multipass_radio = QRadioButton("Multipass")
+        self.lxd_radio = QRadioButton("LXD")
+
+        backend_layout.addWidget(self.multipass_radio)
+        backend_layout.addWidget(self.lxd_radio)
+        layout.addWidget(backend_group)
+        
+        # Default resources
+        resources_group = QGroupBox("Default Resources")
+        resources_layout = QFormLayout(resources_group)
+        
+        self.default_cpu_spin = QSpinBox()
+        self.default_cpu_spin.setRange(1, 16)
+        resources_layout.addRow("CPUs:", self.default_cpu_spin)
+        
+        self.default_memory_spin = QSpinBox()
+        self.default_memory_spin.setRange(512, 16384)
+        self.default_memory_spin.setSuffix(" MB")
+        resources_layout.addRow("Memory:", self.default_memory_spin)
+        
+        layout.addWidget(resources_group)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        
+        save_btn = QPushButton("Save")
+        save_btn.setDefault(True)
+        save_btn.clicked.connect(self.save_settings)
+        button_layout.addWidget(save_btn)
+        
+        layout.addLayout(button_layout)
+
+        self.reload()
+
+    def reload(self):
+        """Populate the widgets from the current configuration
+
+        Called on every showing of the reused dialog; reads all settings
+        up front in one pass through the config.
+        """
+        default_backend = self.config.get('default_backend', 'multipass')
+        if default_backend == 'multipass':
+            self.multipass_radio.setChecked(True)
+        else:
+            self.lxd_radio.setChecked(True)
+        self.default_cpu_spin.setValue(self.config.get('default_cpus', 2))
+        self.default_memory_spin.setValue(self.config.get('default_memory', 2048))
+
+    def save_settings(self):
+        """Save the settings"""
+        settings = {
+            'default_backend': 'multipass' if self.multipass_radio.isChecked() else 'lxd',
+            'default_cpus': self.default_cpu_spin.value(),
+            'default_memory': self.default_memory_spin.value()
+        }
+        
+        self.config.update(settings)
+        self.config.save()
+        self.accept()
+
+
+def main():
+    # Must be set before the QApplication exists. With scaling handled by
+    # Qt and pixmaps served at device resolution, HiDPI rendering avoids
+    # a software upscale of every frame.
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+
+    app = QApplication(sys.argv)
+    app.setApplicationName("Ubuntu Dev Environment Manager")
+    app.setOrganizationName("Canonical")
+    app.setStyleSheet(_APP_STYLE)
+    
+    # Set application icon
+    app.setWindowIcon(QIcon.fromTheme("applications-development"))
+
+    # Default pixmap cache is 10MB; theme icons at several sizes plus
+    # widget backgrounds evict each other at that limit, forcing re-rasters
+    QPixmapCache.setCacheLimit(20480)
+    
+    window = DevEnvironmentGUI()
+    window.show()
+    
+    sys.exit(app.exec_())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+# Upgrade pip
+pip3 install --upgrade pip
+
+# Install core data science packages
+pip3 install numpy pandas matplotlib seaborn plotly
+pip3 install scipy scikit-learn statsmodels
+pip3 install jupyter jupyterlab notebook
+pip3 install h5py tables xarray
+
+# Install ML frameworks
+pip3 install tensorflow torch torchvision
+pip3 install xgboost lightgbm catboost
+
+# Install additional tools
+pip3 install pytest black flake8 mypy
+pip3 install requests beautifulsoup4 openpyxl
+
+# Create project directories
+mkdir -p /home/ubuntu/{projects,datasets,notebooks}
+chown ubuntu:ubuntu /home/ubuntu/{projects,datasets,notebooks}
+
+# Configure Jupyter
+sudo -u ubuntu jupyter notebook --generate-config
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
@@ -0,0 +1,19 @@
+# Install Docker
+curl -fsSL https://download.docker.com/linux/ubuntu/gpg | gpg --dearmor -o /usr/share/keyrings/docker-archive-keyring.gpg
+echo "deb [arch=amd64 signed-by=/usr/share/keyrings/docker-archive-keyring.gpg] https://download.docker.com/linux/ubuntu $(lsb_release -cs) stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null
+apt-get update
+apt-get install -y docker-ce docker-ce-cli containerd.io docker-compose-plugin
+
+# Add ubuntu user to docker group
+usermod -aG docker ubuntu
+
+# Install Docker Compose (standalone; version substituted at template load)
+curl -L "https://github.com/docker/compose/releases/download/${DOCKER_COMPOSE_VERSION}/docker-compose-$(uname -s)-$(uname -m)" -o /usr/local/bin/docker-compose
+chmod +x /usr/local/bin/docker-compose
+
+# Create projects directory
+mkdir -p /home/ubuntu/projects
+chown ubuntu:ubuntu /home/ubuntu/projects
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
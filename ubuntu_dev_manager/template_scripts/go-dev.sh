@@ -0,0 +1,19 @@
+# Install Go (version substituted at template load)
+wget https://golang.org/dl/go${GO_VERSION}.linux-amd64.tar.gz
+rm -rf /usr/local/go && tar -C /usr/local -xzf go${GO_VERSION}.linux-amd64.tar.gz
+rm go${GO_VERSION}.linux-amd64.tar.gz
+
+# Set up Go environment
+echo 'export PATH=$PATH:/usr/local/go/bin' >> /etc/environment
+echo 'export GOPATH=/home/ubuntu/go' >> /etc/environment
+echo 'export PATH=$PATH:/usr/local/go/bin:/home/ubuntu/go/bin' >> /home/ubuntu/.bashrc
+
+# Create Go workspace
+sudo -u ubuntu mkdir -p /home/ubuntu/go/{bin,src,pkg}
+
+# Install common Go tools
+sudo -u ubuntu bash -c 'export PATH=$PATH:/usr/local/go/bin && go install golang.org/x/tools/gopls@latest'
+sudo -u ubuntu bash -c 'export PATH=$PATH:/usr/local/go/bin && go install github.com/golangci/golangci-lint/cmd/golangci-lint@latest'
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
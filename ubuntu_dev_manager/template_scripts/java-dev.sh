@@ -0,0 +1,10 @@
+# Set JAVA_HOME
+echo 'export JAVA_HOME=/usr/lib/jvm/java-17-openjdk-amd64' >> /etc/environment
+echo 'export JAVA_HOME=/usr/lib/jvm/java-17-openjdk-amd64' >> /home/ubuntu/.bashrc
+
+# Create projects directory
+mkdir -p /home/ubuntu/projects
+chown ubuntu:ubuntu /home/ubuntu/projects
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
@@ -0,0 +1,16 @@
+# Install Node.js via NodeSource repository
+curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
+apt-get install -y nodejs
+
+# Install Yarn
+npm install -g yarn
+
+# Install common global packages
+npm install -g typescript ts-node eslint prettier nodemon
+
+# Create project directory
+mkdir -p /home/ubuntu/projects
+chown ubuntu:ubuntu /home/ubuntu/projects
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
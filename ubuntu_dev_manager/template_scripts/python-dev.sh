@@ -0,0 +1,15 @@
+# Upgrade pip
+python3 -m pip install --upgrade pip
+
+# Install common Python packages
+pip3 install virtualenv pipenv poetry
+pip3 install requests flask django fastapi
+pip3 install numpy pandas matplotlib jupyter
+pip3 install pytest black flake8 mypy
+
+# Create project directory
+mkdir -p /home/ubuntu/projects
+chown ubuntu:ubuntu /home/ubuntu/projects
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
@@ -0,0 +1,12 @@
+# Install Rust
+sudo -u ubuntu bash -c 'curl --proto "=https" --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y'
+sudo -u ubuntu bash -c 'source ~/.cargo/env && rustup component add rust-analyzer'
+
+# Add cargo to PATH
+echo 'source ~/.cargo/env' >> /home/ubuntu/.bashrc
+
+# Create projects directory
+sudo -u ubuntu mkdir -p /home/ubuntu/projects
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
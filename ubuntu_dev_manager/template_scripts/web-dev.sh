@@ -0,0 +1,20 @@
+# Install Node.js
+curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -
+apt-get install -y nodejs
+
+# Install Yarn and global packages
+npm install -g yarn typescript eslint prettier
+npm install -g @vue/cli create-react-app @angular/cli
+
+# Install Python packages
+pip3 install --upgrade pip
+pip3 install django flask fastapi sqlalchemy alembic
+pip3 install requests beautifulsoup4 scrapy
+pip3 install pytest black flake8
+
+# Create project directories
+mkdir -p /home/ubuntu/{projects,databases}
+chown ubuntu:ubuntu /home/ubuntu/{projects,databases}
+
+# Set up basic git config
+sudo -u ubuntu git config --global init.defaultBranch main
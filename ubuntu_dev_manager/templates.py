@@ -0,0 +1,307 @@
+"""
+Environment Templates - Predefined development environment configurations
+"""
+
+# Annotations stay strings (PEP 563), so the typing module is never
+# imported at runtime — it is one of the slower stdlib imports and this
+# module sits on the CLI/GUI startup path
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import shlex
+import sys
+import textwrap
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from operator import itemgetter
+from pathlib import Path
+from string import Template as _StrTemplate
+from types import MappingProxyType
+
+from .json_utils import loads
+
+
+@dataclass(frozen=True)
+class Template:
+    """One environment template
+
+    Frozen and slotted: five fixed fields in a dense object layout
+    instead of a per-template dict and its hash table, with attribute
+    access compiled to a slot load. Immutability makes sharing the
+    built-ins across instances safe.
+    """
+    __slots__ = ("name", "description", "base_image", "packages",
+                 "setup_script", "packages_str", "install_cmd")
+
+    name: str
+    description: str
+    base_image: str
+    packages: tuple[str, ...]
+    setup_script: str
+
+    def __post_init__(self):
+        # Derived slots, not fields: the joined package string and the
+        # ready-to-run install command are computed once here so
+        # provisioning never re-joins or re-quotes per run
+        object.__setattr__(self, "packages_str", " ".join(self.packages))
+        object.__setattr__(self, "install_cmd", "apt-get install -y "
+                           + " ".join(shlex.quote(p) for p in self.packages))
+
+    def as_dict(self) -> dict[str, object]:
+        """Dict form for callers that still want mapping access"""
+        return asdict(self)
+
+
+# Fields every custom template must provide
+_REQUIRED_FIELDS = frozenset({"name", "description", "base_image"})
+
+# Template IDs: lowercase, digit/hyphen tail, 2-64 chars — matches the
+# built-in naming scheme; compiled once so validation is a C-level
+# fullmatch per call
+_ID_RE = re.compile(r"[a-z][a-z0-9-]{1,63}")
+
+# Setup scripts live beside the module as plain shell files; they are
+# read on first use and cached, so the kilobytes of script text stay
+# out of this module's bytecode and out of memory until a template is
+# actually materialized
+_SCRIPTS_DIR = Path(__file__).resolve().parent / "template_scripts"
+_SCRIPT_CACHE: dict[str, str] = {}
+
+# Provisioning tool versions, substituted into the scripts at load time.
+# Pinning here replaces the per-provision network pipelines (GitHub API
+# scrapes, stable.txt fetches) the scripts used to run inside every new
+# container, and makes the generated scripts deterministic. Override via
+# the environment to provision a different release.
+_SCRIPT_VARS = {
+    "GO_VERSION": os.environ.get("GO_VERSION", "1.22.5"),
+    "DOCKER_COMPOSE_VERSION": os.environ.get("DOCKER_COMPOSE_VERSION", "v2.27.0"),
+    "KUBECTL_VERSION": os.environ.get("KUBECTL_VERSION", "v1.30.3"),
+}
+
+
+def _load_script(template_id: str) -> str:
+    """Read a template's setup script from disk, cached after first use
+
+    safe_substitute fills the ${...} version pins and leaves the
+    scripts' runtime shell expansions ($PATH, $(...)) untouched.
+    """
+    script = _SCRIPT_CACHE.get(template_id)
+    if script is None:
+        raw = (_SCRIPTS_DIR / f"{template_id}.sh").read_text()
+        script = _SCRIPT_CACHE[template_id] = _canonical_script(
+            _StrTemplate(raw).safe_substitute(_SCRIPT_VARS))
+    return script
+
+
+def _canonical_script(script: str) -> str:
+    """Normalize a setup script once: no common indent, no edge blanks
+
+    Done at load/registration so consumers can write the script straight
+    into a shell without re-scanning it per provision.
+    """
+    return textwrap.dedent(script).strip()
+
+
+# Built-in template metadata lives in templates.json next to the module
+# and is parsed once per process on first use: importing this module no
+# longer executes hundreds of dict-literal bytecodes, and the JSON goes
+# through json_utils (orjson when available). Materialized Template
+# objects are memoized in _BUILT and shared by every instance.
+_DATA_FILE = Path(__file__).resolve().parent / "templates.json"
+_RAW_TEMPLATES: dict[str, dict] = None
+_COMMON_PKGS: tuple[str, ...] = None
+_BUILT: dict[str, Template] = {}
+
+
+def _raw_templates() -> dict[str, dict]:
+    """The metadata table from templates.json, parsed on first use"""
+    global _RAW_TEMPLATES, _COMMON_PKGS
+    if _RAW_TEMPLATES is None:
+        with open(_DATA_FILE, "rb") as f:
+            data = loads(f.read())
+        _COMMON_PKGS = tuple(sys.intern(p) for p in data["common_packages"])
+        _RAW_TEMPLATES = data["templates"]
+    return _RAW_TEMPLATES
+
+
+def _built(template_id: str) -> Template:
+    """Materialize a built-in template on first access, shared process-wide"""
+    template = _BUILT.get(template_id)
+    if template is None:
+        meta = _raw_templates()[template_id]
+        packages = (
+            tuple(sys.intern(p) for p in meta.get("pre_packages", ()))
+            + _COMMON_PKGS
+            + tuple(sys.intern(p) for p in meta.get("extra_packages", ()))
+        )
+        template = _BUILT[template_id] = Template(
+            name=meta["name"],
+            description=meta["description"],
+            base_image=sys.intern(meta["base_image"]),
+            packages=packages,
+            setup_script=_load_script(template_id),
+        )
+    return template
+
+
+class EnvironmentTemplates:
+    # Fixed attribute set: slot access instead of per-instance __dict__,
+    # and a smaller footprint when many instances exist (tests, dialogs)
+    __slots__ = ("_custom", "_tombstones", "_names_cache", "_all_view",
+                 "_items", "_sorted_ids")
+
+    def __init__(self):
+        # Built-ins stay in the shared module registry; per-instance
+        # state is only the custom overlay and the IDs of built-ins this
+        # instance has removed (tombstones), so constructing an instance
+        # copies nothing
+        self._custom: dict[str, Template] = {}
+        self._tombstones = set()
+        # get_template_names result, rebuilt only after add/remove
+        self._names_cache: dict[str, str] = None
+        # Read-only merged registry view handed out by get_all_templates
+        self._all_view = None
+        # (id, Template) pairs for iter_templates, rebuilt after add/remove
+        self._items = None
+        # Sorted template IDs for prefix search; built lazily, then kept
+        # in order incrementally on add/remove
+        self._sorted_ids = None
+
+    def get_all_templates(self) -> dict[str, Template]:
+        """Get all available templates as a read-only mapping
+
+        Returning a MappingProxyType means callers can iterate and index
+        without defensive copies, and accidental mutation raises instead
+        of corrupting the shared registry.
+        """
+        view = self._all_view
+        if view is None:
+            templates = {template_id: _built(template_id)
+                         for template_id in _raw_templates()
+                         if template_id not in self._tombstones}
+            templates.update(self._custom)
+            view = self._all_view = MappingProxyType(templates)
+        return view
+
+    def iter_templates(self) -> tuple:
+        """All (template_id, template) pairs as a cached tuple
+
+        Tuple iteration runs a tighter loop than a dict-items view and
+        the result is built at most once between mutations, so repeated
+        listing (UI refreshes) costs a single attribute load.
+        """
+        items = self._items
+        if items is None:
+            items = self._items = tuple(self.get_all_templates().items())
+        return items
+
+    def _ids_index(self) -> list:
+        """Sorted list of every available template ID"""
+        ids = self._sorted_ids
+        if ids is None:
+            available = set(_raw_templates()).difference(self._tombstones)
+            available.update(self._custom)
+            ids = self._sorted_ids = sorted(available)
+        return ids
+
+    def find_prefix(self, prefix: str) -> list:
+        """Template IDs starting with prefix, in sorted order
+
+        Two binary searches over the sorted index — O(log N + matches)
+        rather than scanning the whole registry, which matters once
+        custom registries grow large.
+        """
+        ids = self._ids_index()
+        lo = bisect.bisect_left(ids, prefix)
+        hi = bisect.bisect_right(ids, prefix + "\uffff", lo)
+        return ids[lo:hi]
+
+    def _has_template(self, template_id: str) -> bool:
+        """Whether an ID currently resolves to a template"""
+        return template_id in self._custom or (
+            template_id in _raw_templates()
+            and template_id not in self._tombstones)
+
+    def get_template(self, template_id: str) -> Template:
+        """Get a specific template by ID; raises KeyError if unknown"""
+        template = self._custom.get(template_id)
+        if template is None:
+            if template_id not in _raw_templates() or template_id in self._tombstones:
+                raise KeyError(template_id)
+            template = _built(template_id)
+        return template
+
+    def get_templates(self, ids: Iterable[str]) -> tuple[Template, ...]:
+        """Resolve a batch of template IDs in one call
+
+        One itemgetter pass over the registry instead of a Python-level
+        method call per ID; raises KeyError if any ID is unknown.
+        """
+        ids = tuple(ids)
+        if not ids:
+            return ()
+        if len(ids) == 1:
+            return (self.get_template(ids[0]),)
+        return itemgetter(*ids)(self.get_all_templates())
+
+    def try_get_template(self, template_id: str) -> Template:
+        """Get a template by ID, or None if unknown"""
+        template = self._custom.get(template_id)
+        if (template is None and template_id in _raw_templates()
+                and template_id not in self._tombstones):
+            template = _built(template_id)
+        return template
+
+    def get_template_names(self) -> dict[str, str]:
+        """Get template IDs mapped to their display names"""
+        names = self._names_cache
+        if names is None:
+            names = {template_id: meta["name"]
+                     for template_id, meta in _raw_templates().items()
+                     if template_id not in self._tombstones}
+            for template_id, template in self._custom.items():
+                names[template_id] = template.name
+            self._names_cache = names
+        return names
+
+    def add_custom_template(self, template_id: str, template_config: dict[str, object]):
+        """Add a custom template"""
+        if not _ID_RE.fullmatch(template_id):
+            raise ValueError(
+                f"Invalid template id: {template_id!r} "
+                "(expected lowercase letters, digits and hyphens)")
+
+        # One C-level set difference instead of a per-field loop, and the
+        # error reports every missing field at once
+        missing = _REQUIRED_FIELDS.difference(template_config)
+        if missing:
+            raise ValueError(f"Template missing required fields: {sorted(missing)}")
+
+        if self._sorted_ids is not None and not self._has_template(template_id):
+            bisect.insort(self._sorted_ids, template_id)
+        self._custom[template_id] = Template(
+            name=template_config["name"],
+            description=template_config["description"],
+            base_image=sys.intern(template_config["base_image"]),
+            packages=tuple(sys.intern(p) for p in template_config.get("packages", ())),
+            setup_script=_canonical_script(template_config.get("setup_script", "")),
+        )
+        self._names_cache = None
+        self._all_view = None
+        self._items = None
+
+    def remove_template(self, template_id: str):
+        """Remove a template (from this instance only, for built-ins)"""
+        if template_id in self._custom:
+            del self._custom[template_id]
+        elif template_id in _raw_templates() and template_id not in self._tombstones:
+            self._tombstones.add(template_id)
+        else:
+            raise ValueError(f"Template {template_id} not found")
+        if self._sorted_ids is not None and not self._has_template(template_id):
+            del self._sorted_ids[bisect.bisect_left(self._sorted_ids, template_id)]
+        self._names_cache = None
+        self._all_view = None
+        self._items = None